@@ -8,9 +8,15 @@ import platform
 import logging
 import functools
 import errno
+import contextlib
+import itertools
+import threading
 import anyio
 from importlib.metadata import version
 
+numpy = None  # Optional speedups for checksum(), imported on first use by _load_checksum_large().
+numba = None
+
 from . import errors
 from .enums import ICMP_DEFAULT_CODE, IcmpType, IcmpTimeExceededCode, IcmpDestinationUnreachableCode
 
@@ -18,17 +24,37 @@ DEBUG = False  # DEBUG: Show debug info for developers. (default False)
 EXCEPTIONS = False  # EXCEPTIONS: Raise exception when delay is not available.
 LOGGER = None  # LOGGER: Record logs into console or file. Logger object should have .debug() method.
 
-IP_HEADER_FORMAT = "!BBHHHBBHII"
+IP_HEADER_FORMAT = "!BBHHHBBH4s4s"  # 4s=source and destination address as raw bytes, ready for socket.inet_ntoa()
 ICMP_HEADER_FORMAT = "!BBHHH"  # According to netinet/ip_icmp.h. !=network byte order(big-endian), B=unsigned char, H=unsigned short
-ICMP_TIME_FORMAT = "!d"  # d=double
+ICMP_TIME_FORMAT = "!Q"  # Q=unsigned long long, nanoseconds of time.monotonic_ns()
 SOCKET_SO_BINDTODEVICE = 25  # socket.SO_BINDTODEVICE
+RECV_BUFFER_SIZE = 1500  # Ethernet MTU, enough for IP Header + ICMP Header + ICMP Payload of any reply we care about.
+DNS_CACHE_SIZE = 256  # Resolved host names kept.
+DNS_CACHE_TIME = 60  # Seconds a resolved host name is kept.
+MAX_IDLE_SOCKETS = 8  # Idle sockets kept per option set. Every open raw socket receives a copy of all ICMP packets.
+MAX_CONCURRENT_PINGS = MAX_IDLE_SOCKETS  # Pings in flight at once in verbose_ping(), each one holds a socket.
+NUMPY_CHECKSUM_MIN_SIZE = 768  # Below this many bytes, numpy/numba call overhead outweighs the vectorized sum.
+
+_IP_HDR = struct.Struct(IP_HEADER_FORMAT)  # Compiled once, so packing does not parse the format string per packet.
+_ICMP_HDR = struct.Struct(ICMP_HEADER_FORMAT)
+_TIME = struct.Struct(ICMP_TIME_FORMAT)
+_UINT16 = struct.Struct("!H")  # A single header field, e.g. the ICMP checksum at offset 2.
+_IP_HDR_SIZE = _IP_HDR.size  # 20
+_ICMP_HDR_SIZE = _ICMP_HDR.size  # 8
+_TIME_SIZE = _TIME.size  # 8
+_ICMP_PAYLOAD_OFF_RAW = _IP_HDR_SIZE + _ICMP_HDR_SIZE  # 28, ICMP Payload offset in a packet with IP Header.
+
+_IS_NON_POSIX = os.name != 'posix'  # Received packets always have an IP Header on Windows and macOS.
+_IS_DARWIN = platform.system() == 'Darwin'
+
+_buffers = threading.local()  # Reusable packet buffers. Each thread runs at most one event loop.
 
 
 def _debug(*args) -> None:
     """Print debug info to stdout if `asyncping3.DEBUG` is True.
 
     Args:
-        *args (any): Usually are strings or objects that can be converted to str.
+        *args (any): Usually are strings or objects that can be converted to str. Callables are called first, so costly messages are only built when `asyncping3.DEBUG` is True.
     """
     def get_logger():
         logger = logging.getLogger(__name__)
@@ -47,7 +73,7 @@ def _debug(*args) -> None:
         return None
     global LOGGER
     LOGGER = LOGGER or get_logger()
-    message = " ".join(str(item) for item in args)
+    message = " ".join(str(item() if callable(item) else item) for item in args)
     LOGGER.debug(message)
 
 
@@ -75,6 +101,8 @@ def _func_logger(func):
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        if not DEBUG:  # Checked per call, DEBUG may be switched on at runtime.
+            return func(*args, **kwargs)
         pargs = ", ".join(str(arg) for arg in args)
         kargs = str(kwargs) if kwargs else ""
         all_args = ", ".join((pargs, kargs)) if (pargs and kargs) else (pargs or kargs)
@@ -97,6 +125,8 @@ def _async_func_logger(func: callable) -> callable:
     """
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
+        if not DEBUG:  # Checked per call, DEBUG may be switched on at runtime.
+            return await func(*args, **kwargs)
         pargs = ", ".join("'{}'".format(arg) if isinstance(arg, str) else arg for arg in args)
         kargs = str(kwargs) if kwargs else ""
         all_args = ", ".join((pargs, kargs)) if (pargs and kargs) else (pargs or kargs)
@@ -108,24 +138,222 @@ def _async_func_logger(func: callable) -> callable:
     return wrapper
 
 
+def _checksum_py(source: bytes) -> int:
+    """Calculates the checksum of the input bytes in pure Python.
+
+    The whole input is read as one little-endian integer, which is folded in halves at 16-bit boundaries.
+    Every fold keeps the ones' complement sum, so no per-byte Python loop is needed.
+
+    Args:
+        source (Bytes): The input to be calculated.
+
+    Returns:
+        int: Calculated checksum.
+    """
+    result = int.from_bytes(source, "little")  # The odd tail byte becomes the low byte of the last word.
+    bits = len(source) * 8
+    while bits > 64:  # Add the high half to the low half, like a 64-bit accumulator but wider.
+        bits = ((bits >> 1) + 15) & ~15  # Round up to a 16-bit boundary.
+        result = (result >> bits) + (result & ((1 << bits) - 1))
+    while result >> 16:  # Ones' complement sum.
+        result = (result >> 16) + (result & 0xffff)  # Each carry add to right most bit.
+    return ~result & 0xffff  # Ensure 16-bit
+
+
+def _checksum_np(source: bytes) -> int:
+    """Calculates the checksum of the input bytes with a vectorized numpy sum.
+
+    Args:
+        source (Bytes): The input to be calculated.
+
+    Returns:
+        int: Calculated checksum.
+    """
+    if len(source) & 1:
+        source = bytes(source) + b"\x00"  # Pad odd length with a zero byte, as RFC1071 does.
+    # Little-endian words, same byte order as _checksum_py(). The caller applies socket.htons().
+    result = int(numpy.frombuffer(source, dtype="<u2").sum(dtype=numpy.uint64))
+    while result >> 16:  # Ones' complement sum.
+        result = (result & 0xffff) + (result >> 16)  # Each carry add to right most bit.
+    return ~result & 0xffff  # Ensure 16-bit
+
+
+def _checksum_kernel(data) -> int:
+    """Ones' complement sum of a uint8 array, walked as little-endian 64-bit words.
+
+    Compiled with `numba.njit` when numba is available.
+
+    Args:
+        data (numpy.ndarray): The input to be calculated, dtype uint8.
+
+    Returns:
+        int: Calculated checksum.
+    """
+    size = data.size
+    total = numpy.uint64(0)
+    i = 0
+    while i < size:
+        word = numpy.uint64(0)
+        for j in range(min(8, size - i)):  # The odd tail byte is padded with zero.
+            word |= numpy.uint64(data[i + j]) << numpy.uint64(8 * j)
+        prev = total
+        total += word
+        if total < prev:  # 64-bit overflow, add the carry back.
+            total += numpy.uint64(1)
+        i += 8
+    for shift in (32, 16, 16, 16):  # Fold 64 -> 32 -> 16 bits, then the remaining carries.
+        total = (total & ((numpy.uint64(1) << numpy.uint64(shift)) - numpy.uint64(1))) + (total >> numpy.uint64(shift))
+    return ~total & numpy.uint64(0xffff)  # Ensure 16-bit
+
+
+def _checksum_nb(source: bytes) -> int:
+    """Calculates the checksum of the input bytes with the numba compiled kernel.
+
+    Args:
+        source (Bytes): The input to be calculated.
+
+    Returns:
+        int: Calculated checksum.
+    """
+    return int(_checksum_kernel(numpy.frombuffer(source, dtype=numpy.uint8)))
+
+
+_checksum_large = None  # Checksum for inputs of at least NUMPY_CHECKSUM_MIN_SIZE bytes, see _load_checksum_large().
+
+
+def _load_checksum_large() -> callable:
+    """Pick the checksum for large inputs, importing numba or numpy when available.
+
+    Done on first use, so `import asyncping3` and small packets never pay for the imports or the compilation.
+
+    Returns:
+        callable: _checksum_nb, _checksum_np or _checksum_py.
+    """
+    global numpy, numba, _checksum_kernel, _checksum_large
+    if _checksum_large is not None:
+        return _checksum_large
+    try:
+        import numpy
+    except ImportError:
+        _checksum_large = _checksum_py
+        return _checksum_large
+    try:
+        import numba
+    except ImportError:
+        _checksum_large = _checksum_np
+        return _checksum_large
+    _checksum_kernel = numba.njit(cache=True)(_checksum_kernel)
+    _checksum_large = _checksum_nb
+    return _checksum_large
+
+
 def checksum(source: bytes) -> int:
     """Calculates the checksum of the input bytes.
 
     RFC1071: https://tools.ietf.org/html/rfc1071
     RFC792: https://tools.ietf.org/html/rfc792
 
+    Large inputs use numba or numpy when available, everything else uses pure Python.
+
     Args:
         source (Bytes): The input to be calculated.
 
     Returns:
         int: Calculated checksum.
     """
-    BITS = 16  # 16-bit long
-    carry = 1 << BITS  # 0x10000
-    result = sum(source[::2]) + (sum(source[1::2]) << (BITS // 2))  # Even bytes (odd indexes) shift 1 byte to the left.
-    while result >= carry:  # Ones' complement sum.
-        result = sum(divmod(result, carry))  # Each carry add to right most bit.
-    return ~result & ((1 << BITS) - 1)  # Ensure 16-bit
+    if len(source) >= NUMPY_CHECKSUM_MIN_SIZE:
+        return (_checksum_large or _load_checksum_large())(source)
+    return _checksum_py(source)
+
+
+@functools.lru_cache(maxsize=8)
+def _padding(length: int) -> bytes:
+    """Get the filler for the ICMP payload after the time.
+
+    Args:
+        length (int): Filler length in bytes. Zero or less means no filler.
+
+    Returns:
+        bytes: `length` bytes of b"Q".
+    """
+    return max(length, 0) * b"Q"
+
+
+def _warm_up_checksum(packet: bytearray) -> None:
+    """Load and compile the checksum for large packets before the first one is timed.
+
+    Otherwise the imports and the numba compilation would be counted in the delay of the first ping.
+
+    Args:
+        packet (bytearray): The ICMP packet buffer.
+    """
+    if len(packet) >= NUMPY_CHECKSUM_MIN_SIZE:
+        checksum(packet)
+
+
+def _get_send_buf(size: int) -> bytearray:
+    """Get the reusable ICMP packet buffer, reallocated when the payload size changes.
+
+    The padding is filled when the buffer is allocated, only the header and time need to be written per ping.
+
+    Args:
+        size (int): The ICMP packet payload size in bytes.
+
+    Returns:
+        bytearray: ICMP header (8) + ICMP payload (at least the time) buffer.
+    """
+    buf = getattr(_buffers, "send", None)
+    if buf is None or len(buf) != _ICMP_HDR_SIZE + max(size, _TIME_SIZE):
+        buf = _buffers.send = bytearray(_ICMP_HDR_SIZE + _TIME_SIZE) + _padding(size - _TIME_SIZE)
+        _warm_up_checksum(buf)
+    return buf
+
+
+def _get_recv_buf() -> bytearray:
+    """Get the reusable buffer for received packets.
+
+    Returns:
+        bytearray: Buffer of `RECV_BUFFER_SIZE` bytes.
+    """
+    recv_buf = getattr(_buffers, "recv", None)
+    if recv_buf is None:
+        recv_buf = _buffers.recv = bytearray(RECV_BUFFER_SIZE)
+    return recv_buf
+
+
+_resolved = {}  # Host name -> (IP address, expiry time), oldest first.
+
+
+async def _resolve(dest_addr: str) -> str:
+    """Resolve a host name to an IPv4 address, using the cache of recent results.
+
+    Args:
+        dest_addr (str): The destination address, can be an IP address or a domain name. Ex. "192.168.1.1"/"example.com"
+
+    Returns:
+        str: The IP address. Ex. "192.168.1.1"
+
+    Raises:
+        HostUnkown: If destination address is a domain name and cannot resolved.
+    """
+    try:
+        socket.inet_pton(socket.AF_INET, dest_addr)  # Already an IP address, nothing to resolve.
+        return dest_addr
+    except OSError:
+        pass
+    now = time.monotonic()
+    cached = _resolved.get(dest_addr)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    try:
+        ip_addr = (await anyio.getaddrinfo(dest_addr, 0, family=socket.AF_INET))[0][4][0]
+    except socket.gaierror as err:
+        raise errors.HostUnknown(dest_addr=dest_addr) from err
+    _resolved.pop(dest_addr, None)  # Re-insert as newest.
+    if len(_resolved) >= DNS_CACHE_SIZE:
+        del _resolved[next(iter(_resolved))]  # Drop the oldest.
+    _resolved[dest_addr] = (ip_addr, now + DNS_CACHE_TIME)
+    return ip_addr
 
 
 def read_icmp_header(raw: bytes) -> dict:
@@ -138,7 +366,7 @@ def read_icmp_header(raw: bytes) -> dict:
         dict: A map contains the infos from the raw header.
     """
     icmp_header_keys = ('type', 'code', 'checksum', 'id', 'seq')
-    return dict(zip(icmp_header_keys, struct.unpack(ICMP_HEADER_FORMAT, raw)))
+    return dict(zip(icmp_header_keys, _ICMP_HDR.unpack(raw)))
 
 
 def read_ip_header(raw: bytes) -> dict:
@@ -150,22 +378,48 @@ def read_ip_header(raw: bytes) -> dict:
     Returns:
         dict: A map contains the infos from the raw header.
     """
-    def stringify_ip(ip: int) -> str:
-        return ".".join(str(ip >> offset & 0xff) for offset in (24, 16, 8, 0))  # str(ipaddress.ip_address(ip))
-
     ip_header_keys = ('version', 'tos', 'len', 'id', 'flags', 'ttl', 'protocol', 'checksum', 'src_addr', 'dest_addr')
-    ip_header = dict(zip(ip_header_keys, struct.unpack(IP_HEADER_FORMAT, raw)))
-    ip_header['src_addr'] = stringify_ip(ip_header['src_addr'])
-    ip_header['dest_addr'] = stringify_ip(ip_header['dest_addr'])
+    ip_header = dict(zip(ip_header_keys, _IP_HDR.unpack(raw)))
+    ip_header['src_addr'] = socket.inet_ntoa(ip_header['src_addr'])
+    ip_header['dest_addr'] = socket.inet_ntoa(ip_header['dest_addr'])
     return ip_header
 
 
+async def _send_packet(sock: socket.socket, packet: bytearray, ip_addr: str, icmp_id: int, seq: int) -> int:
+    """Fill in an ICMP echo request packet and send it.
+
+    Args:
+        sock (socket.socket): Socket.
+        packet (bytearray): The packet buffer, header followed by the payload. The padding after the time is left as is.
+        ip_addr (str): The destination IP address. Ex. "192.168.1.1"
+        icmp_id (int): ICMP packet id.
+        seq (int): ICMP packet sequence.
+
+    Returns:
+        int: The time in the sent payload, in nanoseconds of time.monotonic_ns().
+    """
+    while True:
+        # The packet is built right before sendto(), so no other task can overwrite a shared buffer in between.
+        pseudo_checksum = 0  # Pseudo checksum is used to calculate the real checksum.
+        _ICMP_HDR.pack_into(packet, 0, IcmpType.ECHO_REQUEST, ICMP_DEFAULT_CODE, pseudo_checksum, icmp_id, seq)
+        send_time = time.monotonic_ns()
+        _TIME.pack_into(packet, _ICMP_HDR_SIZE, send_time)
+        real_checksum = checksum(packet)  # Calculates the checksum on the dummy header and the icmp_payload.
+        # Don't know why I need socket.htons() on real_checksum since ICMP_HEADER_FORMAT already in Network Bytes Order (big-endian)
+        _UINT16.pack_into(packet, 2, socket.htons(real_checksum))  # Put real checksum into ICMP header, the other fields are already set.
+        try:
+            sock.sendto(packet, (ip_addr, 0))  # addr = (ip, port). Port is 0 respectively the OS default behavior will be used.
+            return send_time
+        except BlockingIOError:  # Send buffer is full, which is rare. Wait and build the packet again.
+            await anyio.wait_socket_writable(sock)
+
+
 @_async_func_logger
-async def send_one_ping(sock: socket.socket, dest_addr: str, icmp_id: int, seq: int, size: int) -> None:
+async def send_one_ping(sock: socket.socket, dest_addr: str, icmp_id: int, seq: int, size: int, packet: bytearray = None) -> int:
     """Sends one ping to the given destination.
 
     ICMP Header (bits): type (8), code (8), checksum (16), id (16), sequence (16)
-    ICMP Payload: time (double), data
+    ICMP Payload: time (unsigned long long, monotonic nanoseconds), data
     ICMP Wikipedia: https://en.wikipedia.org/wiki/Internet_Control_Message_Protocol
 
     Args:
@@ -174,32 +428,26 @@ async def send_one_ping(sock: socket.socket, dest_addr: str, icmp_id: int, seq:
         icmp_id (int): ICMP packet id. Calculated from Process ID and Thread ID.
         seq (int): ICMP packet sequence, usually increases from 0 in the same process.
         size (int): The ICMP packet payload size in bytes. Note this is only for the payload part.
+        packet (bytearray | None): The packet buffer to send from, `size` is ignored then. Default is None, which means the reusable buffer of this thread. (default None)
+
+    Returns:
+        int: The time in the sent payload, in nanoseconds of time.monotonic_ns().
 
     Raises:
         HostUnkown: If destination address is a domain name and cannot resolved.
     """
     _debug("Destination address: '{}'".format(dest_addr))
-    try:
-        dest_addr = (await anyio.getaddrinfo(dest_addr, 0, family=socket.AF_INET))[0][4][0]
-    except socket.gaierror as err:
-        raise errors.HostUnknown(dest_addr=dest_addr) from err
+    dest_addr = await _resolve(dest_addr)
     _debug("Destination IP address:", dest_addr)
-    pseudo_checksum = 0  # Pseudo checksum is used to calculate the real checksum.
-    icmp_header = struct.pack(ICMP_HEADER_FORMAT, IcmpType.ECHO_REQUEST, ICMP_DEFAULT_CODE, pseudo_checksum, icmp_id, seq)
-    padding = (size - struct.calcsize(ICMP_TIME_FORMAT)) * "Q"  # Using double to store current time.
-    icmp_payload = struct.pack(ICMP_TIME_FORMAT, time.time()) + padding.encode()
-    real_checksum = checksum(icmp_header + icmp_payload)  # Calculates the checksum on the dummy header and the icmp_payload.
-    # Don't know why I need socket.htons() on real_checksum since ICMP_HEADER_FORMAT already in Network Bytes Order (big-endian)
-    icmp_header = struct.pack(ICMP_HEADER_FORMAT, IcmpType.ECHO_REQUEST, ICMP_DEFAULT_CODE, socket.htons(real_checksum), icmp_id, seq)  # Put real checksum into ICMP header.
-    _debug("Sent ICMP header:", read_icmp_header(icmp_header))
-    _debug("Sent ICMP payload:", icmp_payload)
-    packet = icmp_header + icmp_payload
-    await anyio.wait_socket_writable(sock)
-    sock.sendto(packet, (dest_addr, 0))  # addr = (ip, port). Port is 0 respectively the OS default behavior will be used.
+    packet = _get_send_buf(size) if packet is None else packet
+    send_time = await _send_packet(sock=sock, packet=packet, ip_addr=dest_addr, icmp_id=icmp_id, seq=seq)
+    _debug("Sent ICMP header:", lambda: read_icmp_header(packet[:_ICMP_HDR_SIZE]))
+    _debug("Sent ICMP payload:", lambda: bytes(packet[_ICMP_HDR_SIZE:]))
+    return send_time
 
 
 @_async_func_logger
-async def receive_one_ping(sock: socket, icmp_id: int, seq: int, timeout: int) -> float:
+async def receive_one_ping(sock: socket, icmp_id: int, seq: int, timeout: int, send_time: int = 0) -> float:
     """Receives the ping from the socket.
 
     IP Header (bits): version (8), type of service (8), length (16), id (16), flags (16), time to live (8), protocol (8), checksum (16), source ip (32), destination ip (32).
@@ -212,6 +460,7 @@ async def receive_one_ping(sock: socket, icmp_id: int, seq: int, timeout: int) -
         icmp_id (int): ICMP packet id. Sent packet id should be identical with received packet id.
         seq (int): ICMP packet sequence. Sent packet sequence should be identical with received packet sequence.
         timeout (int): Timeout in seconds.
+        send_time (int): The time in the sent payload, as returned by send_one_ping(). Replies carrying an earlier time are late replies to previous pings on the same socket and are filtered out. (default 0)
 
     Returns:
         float | None: The delay in seconds or None on timeout.
@@ -222,84 +471,78 @@ async def receive_one_ping(sock: socket, icmp_id: int, seq: int, timeout: int) -
         DestinationHostUnreachable: If the destination host is unreachable.
         DestinationUnreachable: If the destination is unreachable.
     """
-    has_ip_header = (os.name != 'posix') or (platform.system() == 'Darwin') or (sock.type == socket.SOCK_RAW)  # No IP Header when unprivileged on Linux.
+    has_ip_header = _IS_NON_POSIX or _IS_DARWIN or (sock.type == socket.SOCK_RAW)  # No IP Header when unprivileged on Linux.
     if has_ip_header:
-        ip_header_slice = slice(0, struct.calcsize(IP_HEADER_FORMAT))  # [0:20]
-        icmp_header_slice = slice(ip_header_slice.stop, ip_header_slice.stop + struct.calcsize(ICMP_HEADER_FORMAT))  # [20:28]
+        icmp_offset, payload_offset = _IP_HDR_SIZE, _ICMP_PAYLOAD_OFF_RAW  # [20:28], [28:]
     else:
         _debug("Unprivileged on Linux")
-        icmp_header_slice = slice(0, struct.calcsize(ICMP_HEADER_FORMAT))  # [0:8]
+        icmp_offset, payload_offset = 0, _ICMP_HDR_SIZE  # [0:8], [8:]
     timeout_time = time.time() + timeout  # Exactly time when timeout.
-    _debug("Timeout time: {} ({})".format(time.ctime(timeout_time), timeout_time))
+    _debug(lambda: "Timeout time: {} ({})".format(time.ctime(timeout_time), timeout_time))
     with anyio.fail_after(timeout):
         while True:
             await anyio.wait_socket_readable(sock)
-            time_recv = time.time()
-            recv_data, addr = sock.recvfrom(1024)
-            _debug("Received time: {} ({}))".format(time.ctime(time_recv), time_recv))
+            time_recv = time.monotonic_ns()
+            # Parsed before the next await, so no other task can overwrite the shared buffer meanwhile.
+            recv_data = _get_recv_buf()
+            try:
+                recv_size = sock.recv_into(recv_data)  # Raw socket, the sender address is not needed.
+            except BlockingIOError:  # Woken up without a packet to read.
+                continue
+            _debug(lambda: "Received time: {}ns (monotonic)".format(time_recv))
             if has_ip_header:
-                ip_header_raw = recv_data[ip_header_slice]
-                ip_header = read_ip_header(ip_header_raw)
-                _debug("Received IP Header:", ip_header)
-            else:
-                ip_header = None
-            icmp_header_raw, icmp_payload_raw = recv_data[icmp_header_slice], recv_data[icmp_header_slice.stop:]
-            icmp_header = read_icmp_header(icmp_header_raw)
-            _debug("Received ICMP Header:", icmp_header)
-            _debug("Received ICMP Payload:", icmp_payload_raw)
+                _debug("Received IP Header:", lambda: read_ip_header(recv_data[:_IP_HDR_SIZE]))
+            if recv_size < payload_offset:  # Truncated packet, the rest of the buffer holds stale data.
+                _debug("Packet too short. Packet filtered out.")
+                continue
+            icmp_type, icmp_code, _, recv_id, recv_seq = _ICMP_HDR.unpack_from(recv_data, icmp_offset)
+            _debug("Received ICMP Header:", lambda: read_icmp_header(recv_data[icmp_offset:payload_offset]))
+            _debug("Received ICMP Payload:", lambda: bytes(recv_data[payload_offset:recv_size]))
             if not has_ip_header:  #  When unprivileged on Linux, ICMP ID is rewrited by kernel.
                 icmp_id = sock.getsockname()[1]  # According to https://stackoverflow.com/a/14023878/4528364
-            if icmp_header['id'] and icmp_header['id'] != icmp_id:  # ECHO_REPLY should match the ID field.
+            if recv_id and recv_id != icmp_id:  # ECHO_REPLY should match the ID field.
                 _debug("ICMP ID dismatch. Packet filtered out.")
                 continue
-            if icmp_header['type'] == IcmpType.ECHO_REQUEST:  # filters out the ECHO_REQUEST itself.
+            if icmp_type == IcmpType.ECHO_REQUEST:  # filters out the ECHO_REQUEST itself.
                 _debug("ECHO_REQUEST received. Packet filtered out.")
                 continue
-            if icmp_header['type'] == IcmpType.TIME_EXCEEDED:  # TIME_EXCEEDED has no icmp_id and icmp_seq. Usually they are 0.
-                if icmp_header['code'] == IcmpTimeExceededCode.TTL_EXPIRED:
+            if icmp_type == IcmpType.TIME_EXCEEDED:  # TIME_EXCEEDED has no icmp_id and icmp_seq. Usually they are 0.
+                if icmp_code == IcmpTimeExceededCode.TTL_EXPIRED:
                     raise errors.TimeToLiveExpired()  # Some router does not report TTL expired and then timeout shows.
                 raise errors.TimeExceeded()
-            if icmp_header['type'] == IcmpType.DESTINATION_UNREACHABLE:  # DESTINATION_UNREACHABLE has no icmp_id and icmp_seq. Usually they are 0.
-                if icmp_header['code'] == IcmpDestinationUnreachableCode.DESTINATION_HOST_UNREACHABLE:
+            if icmp_type == IcmpType.DESTINATION_UNREACHABLE:  # DESTINATION_UNREACHABLE has no icmp_id and icmp_seq. Usually they are 0.
+                if icmp_code == IcmpDestinationUnreachableCode.DESTINATION_HOST_UNREACHABLE:
                     raise errors.DestinationHostUnreachable()
                 raise errors.DestinationUnreachable()
-            if icmp_header['id'] != icmp_id:  # ECHO_REPLY should match the ICMP ID field.
+            if recv_id != icmp_id:  # ECHO_REPLY should match the ICMP ID field.
                 _debug("ICMP ID dismatch. Packet filtered out.")
                 continue
-            if icmp_header['seq'] != seq:  # ECHO_REPLY should match the ICMP SEQ field.
+            if recv_seq != seq:  # ECHO_REPLY should match the ICMP SEQ field.
                 _debug("IMCP SEQ dismatch. Packet filtered out.")
                 continue
-            if icmp_header['type'] == IcmpType.ECHO_REPLY:
-                time_sent = struct.unpack(ICMP_TIME_FORMAT, icmp_payload_raw[0:struct.calcsize(ICMP_TIME_FORMAT)])[0]
-                _debug("Received sent time: {} ({})".format(time.ctime(time_sent), time_sent))
-                return time_recv - time_sent
-        _debug("Ignored ICMP packet:", icmp_header)
-
-_seq_id = 0
-
-@_async_func_logger
-async def ping(dest_addr: str, timeout: int = 4, unit: str = "s", src_addr: str = None, ttl: int = None, seq: int = 0, size: int = 56, interface: str = None) -> float:
-    """
-    Send one ping to destination address with the given timeout.
+            if icmp_type == IcmpType.ECHO_REPLY:
+                if recv_size < payload_offset + _TIME_SIZE:  # No room for the sent time, the rest of the buffer holds stale data.
+                    _debug("Payload too short. Packet filtered out.")
+                    continue
+                time_sent = _TIME.unpack_from(recv_data, payload_offset)[0]
+                _debug(lambda: "Received sent time: {}ns (monotonic)".format(time_sent))
+                if time_sent < send_time:  # Unprivileged sockets keep their ICMP ID when reused, and seq is often 0.
+                    _debug("Late reply to an earlier ping. Packet filtered out.")
+                    continue
+                return (time_recv - time_sent) / 1e9
+        _debug("Ignored ICMP packet:", lambda: read_icmp_header(recv_data[icmp_offset:payload_offset]))
+
+def _create_socket(ttl: int = None, interface: str = None, src_addr: str = None) -> socket.socket:
+    """Create an ICMP socket with the given options.
 
     Args:
-        dest_addr (str): The destination address, can be an IP address or a domain name. Ex. "192.168.1.1"/"example.com"
-        timeout (int): Time to wait for a response, in seconds. Default is 4s, same as Windows CMD. (default 4)
-        unit (str): The unit of returned value. "s" for seconds, "ms" for milliseconds. (default "s")
-        src_addr (str): The IP address to ping from. This is for multiple network interfaces. Ex. "192.168.1.20". (default "")
-        interface (str): LINUX ONLY. The gateway network interface to ping from. Ex. "wlan0". (default "")
-        ttl (int | None): The Time-To-Live of the outgoing packet. Default is None, which means using OS default ttl -- 64 onLinux and macOS, and 128 on Windows. (default None)
-        seq (int): ICMP packet sequence, usually increases from 0 in the same process. (default 0)
-        size (int): The ICMP packet payload size in bytes. If the input of this is less than the bytes of a double format (usually 8), the size of ICMP packet payload is 8 bytes to hold a time. The max should be the router_MTU(Usually 1480) - IP_Header(20) - ICMP_Header(8). Default is 56, same as in macOS. (default 56)
+        ttl (int | None): The Time-To-Live of the outgoing packet. None means using OS default ttl. (default None)
+        interface (str): LINUX ONLY. The gateway network interface to ping from. Ex. "wlan0". (default None)
+        src_addr (str): The IP address to ping from. Ex. "192.168.1.20". (default None)
 
     Returns:
-        float | None | False: The delay in seconds/milliseconds, False on error and None on timeout.
-
-    Raises:
-        PingError: Any PingError will raise again if `asyncping3.EXCEPTIONS` is True.
+        socket.socket: A raw ICMP socket, or a datagram ICMP socket when unprivileged on Linux.
     """
-    global _seq_id
-
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
     except PermissionError as err:
@@ -308,50 +551,211 @@ async def ping(dest_addr: str, timeout: int = 4, unit: str = "s", src_addr: str
             sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
         else:
             raise err
-    with sock:
+    try:
         if ttl:
             try:  # IPPROTO_IP is for Windows and BSD Linux.
-                if sock.getsockopt(socket.IPPROTO_IP, socket.IP_TTL):
-                    sock.setsockopt(socket.IPPROTO_IP, socket.IP_TTL, ttl)
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_TTL, ttl)
             except OSError as err:
                 _debug("Set Socket Option `IP_TTL` in `IPPROTO_IP` Failed: {}".format(err))
-            try:
-                if sock.getsockopt(socket.SOL_IP, socket.IP_TTL):
+                try:
                     sock.setsockopt(socket.SOL_IP, socket.IP_TTL, ttl)
-            except OSError as err:
-                _debug("Set Socket Option `IP_TTL` in `SOL_IP` Failed: {}".format(err))
+                except OSError as err:
+                    _debug("Set Socket Option `IP_TTL` in `SOL_IP` Failed: {}".format(err))
         if interface:
             sock.setsockopt(socket.SOL_SOCKET, SOCKET_SO_BINDTODEVICE, interface.encode())  # packets will be sent from specified interface.
             _debug("Socket Interface Binded:", interface)
         if src_addr:
             sock.bind((src_addr, 0))  # only packets send to src_addr are received.
             _debug("Socket Source Address Binded:", src_addr)
-        process_id = os.getpid()  # If ping() run under different process, thread_id may be identical.
-        icmp_id = (((process_id << 5) | _seq_id) ^ (process_id >> 11)) & 0xffff  # to avoid icmp_id collision.
-        _seq_id += 1
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _drain_socket(sock: socket.socket) -> None:
+    """Discard packets queued on an idle socket, e.g. late replies to earlier pings.
+
+    Args:
+        sock (socket.socket): A non-blocking socket.
+    """
+    recv_buf = _get_recv_buf()
+    try:
+        while sock.recv_into(recv_buf):
+            pass
+    except OSError:  # BlockingIOError when the queue is empty.
+        pass
+
+
+_sock_pool = {}  # (ttl, interface, src_addr) -> list of idle sockets.
+
+
+@contextlib.contextmanager
+def _pooled_socket(ttl: int = None, interface: str = None, src_addr: str = None):
+    """Check out an idle socket with the given options, or create one, and put it back afterwards.
+
+    A socket is only used by one ping at a time. Concurrent pings get sockets of their own.
+
+    Args:
+        ttl (int | None): The Time-To-Live of the outgoing packet. None means using OS default ttl. (default None)
+        interface (str): LINUX ONLY. The gateway network interface to ping from. Ex. "wlan0". (default None)
+        src_addr (str): The IP address to ping from. Ex. "192.168.1.20". (default None)
+
+    Yields:
+        socket.socket: A non-blocking ICMP socket.
+    """
+    key = (ttl or None, interface or None, src_addr or None)
+    try:
+        sock = _sock_pool[key].pop()
+    except (KeyError, IndexError):
+        sock = _create_socket(*key)
+        sock.setblocking(False)
+    else:
+        _drain_socket(sock)
+    try:
+        yield sock
+    finally:
+        idle = _sock_pool.setdefault(key, [])
+        if len(idle) < MAX_IDLE_SOCKETS:
+            idle.append(sock)
+        else:
+            sock.close()
+
+
+def close_all() -> None:
+    """Close all idle sockets kept for reuse by ping().
+
+    Sockets in use by a running ping() are put back afterwards as usual.
+    """
+    for idle in list(_sock_pool.values()):
+        while idle:
+            idle.pop().close()
+
+
+_process_id = os.getpid()  # If ping() run under different process, thread_id may be identical.
+_seq_id = 0
+
+
+def _next_icmp_id() -> int:
+    """Get a new ICMP id for this process.
+
+    Returns:
+        int: ICMP packet id. Calculated from Process ID and a counter.
+    """
+    global _seq_id
+    icmp_id = (((_process_id << 5) | _seq_id) ^ (_process_id >> 11)) & 0xffff  # to avoid icmp_id collision.
+    _seq_id += 1
+    return icmp_id
+
+
+def _after_fork_in_child() -> None:
+    """Forget the parent's process id and sockets, a shared socket would steal its replies."""
+    global _process_id
+    _process_id = os.getpid()
+    close_all()
+
+
+if hasattr(os, "register_at_fork"):  # Not on Windows.
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+async def _ping_with(sock: socket.socket, dest_addr: str, icmp_id: int, seq: int, size: int, timeout: int, unit: str, packet: bytearray = None) -> float:
+    """Send one ping on the given socket and wait for its reply, shared by ping() and make_pinger().
+
+    Args:
+        sock (socket.socket): Socket.
+        dest_addr (str): The destination address, can be an IP address or a domain name. Ex. "192.168.1.1"/"example.com"
+        icmp_id (int): ICMP packet id.
+        seq (int): ICMP packet sequence.
+        size (int): The ICMP packet payload size in bytes.
+        timeout (int): Time to wait for a response, in seconds.
+        unit (str): The unit of returned value. "s" for seconds, "ms" for milliseconds.
+        packet (bytearray | None): The packet buffer to send from, see send_one_ping(). (default None)
+
+    Returns:
+        float | None | False: The delay in seconds/milliseconds, False on error and None on timeout.
+
+    Raises:
+        PingError: Any PingError will raise again if `asyncping3.EXCEPTIONS` is True.
+    """
+    try:
+        send_time = await send_one_ping(sock=sock, dest_addr=dest_addr, icmp_id=icmp_id, seq=seq, size=size, packet=packet)
         try:
-            await send_one_ping(sock=sock, dest_addr=dest_addr, icmp_id=icmp_id, seq=seq, size=size)
-            try:
-                delay = await receive_one_ping(sock=sock, icmp_id=icmp_id, seq=seq, timeout=timeout)  # in seconds
-            except TimeoutError:
-                raise errors.Timeout(timeout=timeout) from None
-        except errors.HostUnknown as err:  # Unsolved
-            _debug(err)
-            _raise(err)
-            return False
-        except errors.PingError as err:
-            _debug(err)
-            _raise(err)
-            return None
-        except errors.PingError as err:
-            _debug(err)
-            _raise(err)
-            return False
-        if delay is None:
-            return None
-        if unit == "ms":
-            delay *= 1000  # in milliseconds
-        return delay
+            delay = await receive_one_ping(sock=sock, icmp_id=icmp_id, seq=seq, timeout=timeout, send_time=send_time)  # in seconds
+        except TimeoutError:
+            raise errors.Timeout(timeout=timeout) from None
+    except errors.HostUnknown as err:  # Unsolved
+        _debug(err)
+        _raise(err)
+        return False
+    except errors.PingError as err:
+        _debug(err)
+        _raise(err)
+        return None
+    if delay is None:
+        return None
+    if unit == "ms":
+        delay *= 1000  # in milliseconds
+    return delay
+
+
+@_async_func_logger
+async def ping(dest_addr: str, timeout: int = 4, unit: str = "s", src_addr: str = None, ttl: int = None, seq: int = 0, size: int = 56, interface: str = None, sock: socket.socket = None) -> float:
+    """
+    Send one ping to destination address with the given timeout.
+
+    Args:
+        dest_addr (str): The destination address, can be an IP address or a domain name. Ex. "192.168.1.1"/"example.com"
+        timeout (int): Time to wait for a response, in seconds. Default is 4s, same as Windows CMD. (default 4)
+        unit (str): The unit of returned value. "s" for seconds, "ms" for milliseconds. (default "s")
+        src_addr (str): The IP address to ping from. This is for multiple network interfaces. Ex. "192.168.1.20". (default "")
+        interface (str): LINUX ONLY. The gateway network interface to ping from. Ex. "wlan0". (default "")
+        ttl (int | None): The Time-To-Live of the outgoing packet. Default is None, which means using OS default ttl -- 64 onLinux and macOS, and 128 on Windows. (default None)
+        seq (int): ICMP packet sequence, usually increases from 0 in the same process. (default 0)
+        size (int): The ICMP packet payload size in bytes. If the input of this is less than the bytes of the time (8), the size of ICMP packet payload is 8 bytes to hold a time. The max should be the router_MTU(Usually 1480) - IP_Header(20) - ICMP_Header(8). Default is 56, same as in macOS. (default 56)
+        sock (socket.socket | None): An open ICMP socket to ping with. It is left open, and `src_addr`, `interface` and `ttl` are not applied to it. It must not be shared by pings running at the same time, each one would read and drop the others' replies. Default is None, which means an idle socket with these options is reused, or a new one is created. See close_all(). (default None)
+
+    Returns:
+        float | None | False: The delay in seconds/milliseconds, False on error and None on timeout.
+
+    Raises:
+        PingError: Any PingError will raise again if `asyncping3.EXCEPTIONS` is True.
+    """
+    with _pooled_socket(ttl=ttl, interface=interface, src_addr=src_addr) if sock is None else contextlib.nullcontext(sock) as sock:
+        return await _ping_with(sock=sock, dest_addr=dest_addr, icmp_id=_next_icmp_id(), seq=seq, size=size, timeout=timeout, unit=unit)
+
+
+def make_pinger(dest_addr: str, timeout: int = 4, unit: str = "s", src_addr: str = None, ttl: int = None, size: int = 56, interface: str = None) -> callable:
+    """
+    Prepare repeated pings to one destination address with fixed options, e.g. for health checks.
+
+    The ICMP id and packet are set up once, each ping only fills in the header and time.
+
+    Args:
+        dest_addr (str): The destination address, can be an IP address or a domain name. Ex. "192.168.1.1"/"example.com"
+        timeout (int): Time to wait for a response, in seconds. (default 4)
+        unit (str): The unit of returned value. "s" for seconds, "ms" for milliseconds. (default "s")
+        src_addr (str): The IP address to ping from. Ex. "192.168.1.20". (default None)
+        ttl (int | None): The Time-To-Live of the outgoing packet. None means using OS default ttl. (default None)
+        size (int): The ICMP packet payload size in bytes. (default 56)
+        interface (str): LINUX ONLY. The gateway network interface to ping from. Ex. "wlan0". (default None)
+
+    Returns:
+        callable: Coroutine function `pinger(seq=None)`, which sends one ping and returns the same as ping(). Without `seq`, the sequence increases from 0 on each call.
+    """
+    icmp_id = _next_icmp_id()
+    packet = bytearray(_ICMP_HDR_SIZE + _TIME_SIZE) + _padding(size - _TIME_SIZE)  # Header and time are filled in on each send.
+    _warm_up_checksum(packet)
+    seqs = itertools.count()
+
+    @_async_func_logger
+    async def pinger(seq: int = None) -> float:
+        if seq is None:
+            seq = next(seqs) & 0xffff  # ICMP sequence is 16 bits, wraps around.
+        with _pooled_socket(ttl=ttl, interface=interface, src_addr=src_addr) as sock:
+            return await _ping_with(sock=sock, dest_addr=dest_addr, icmp_id=icmp_id, seq=seq, size=size, timeout=timeout, unit=unit, packet=packet)
+
+    return pinger
 
 
 @_async_func_logger
@@ -362,7 +766,7 @@ async def verbose_ping(dest_addr: str, count: int = 4, interval: float = 0, *arg
     Args:
         dest_addr (str): The destination address. Ex. "192.168.1.1"/"example.com"
         count (int): How many pings should be sent. 0 means infinite loops until manually stopped. Default is 4, same as Windows CMD. (default 4)
-        interval (float): How many seconds between two packets. Default is 0, which means send the next packet as soon as the previous one responsed. (default 0)
+        interval (float): How many seconds between two packets. Default is 0, which means up to `MAX_CONCURRENT_PINGS` packets are in flight at once, or with infinite loops, send the next packet as soon as the previous one responsed. (default 0)
         *args and **kwargs (any): And all the other arguments available in ping() except `seq`.
 
     Output:
@@ -371,14 +775,10 @@ async def verbose_ping(dest_addr: str, count: int = 4, interval: float = 0, *arg
     timeout = kwargs.get("timeout")
     src = kwargs.get("src_addr")
     unit = kwargs.setdefault("unit", "ms")
-    i = 0
-    while i < count or count == 0:
-        if interval > 0 and i > 0:
-            await anyio.sleep(interval)
-        output_text = "ping '{}'".format(dest_addr)
-        output_text += " from '{}'".format(src) if src else ""
-        output_text += " ... "
-        delay = await ping(dest_addr, seq=i, *args, **kwargs)
+
+    output_text = "ping '{}' from '{}' ... ".format(dest_addr, src) if src else "ping '{}' ... ".format(dest_addr)
+
+    def print_result(delay):
         print(output_text, end="")
         if delay is None:
             print("Timeout > {}s".format(timeout) if timeout else "Timeout")
@@ -386,4 +786,33 @@ async def verbose_ping(dest_addr: str, count: int = 4, interval: float = 0, *arg
             print("Error")
         else:
             print("{value}{unit}".format(value=int(delay), unit=unit))
-        i += 1
+
+    if interval == 0 and count > 0 and kwargs.get("sock") is None:  # Nothing to wait for between packets, so don't wait for the replies either. A given socket can only serve one ping at a time.
+        results = [None] * count
+        limiter = anyio.CapacityLimiter(MAX_CONCURRENT_PINGS)  # Bounds open sockets, every ICMP socket receives all replies.
+
+        async def run(i):
+            async with limiter:
+                try:
+                    results[i] = await ping(dest_addr, seq=i, *args, **kwargs)
+                except Exception as err:  # Raised in order below, same as one ping after another.
+                    results[i] = err
+
+        async with anyio.create_task_group() as tg:
+            for i in range(count):
+                tg.start_soon(run, i)  # Each ping checks out its own socket.
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+            print_result(result)
+        return
+
+    seqs = iter(itertools.count() if count == 0 else range(count))  # 0 means infinite loops.
+    i = next(seqs, None)
+    if i is None:  # Negative count, nothing to send.
+        return
+    print_result(await ping(dest_addr, seq=i, *args, **kwargs))  # No interval before the first packet.
+    for i in seqs:
+        if interval > 0:
+            await anyio.sleep(interval)
+        print_result(await ping(dest_addr, seq=i, *args, **kwargs))
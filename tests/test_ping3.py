@@ -6,6 +6,7 @@ import pytest
 import time
 from unittest.mock import patch
 import socket
+import anyio
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import asyncping3 as ping3  # noqa: linter (pycodestyle) should not lint this line.
@@ -16,6 +17,140 @@ DEST_DOMAIN = 'example.com'
 class TestPing3:
     """ping3 unittest"""
 
+    def test_checksum(self):
+        data = bytes.fromhex("0001f203f4f5f6f7")  # RFC1071 numerical example, one's complement sum 0xddf2.
+        self.assertEqual(ping3.checksum(data), 0x0d22)  # Little-endian words, socket.htons() is applied when sending.
+        self.assertEqual(ping3.checksum(data + b"\x01"), ping3._checksum_py(data + b"\x01"))
+
+    def test_checksum_large(self):
+        data = bytes(range(256)) * 6 + b"\xff"  # Large enough for the vectorized path, odd length.
+        self.assertEqual(ping3.checksum(data), ping3._checksum_py(data))
+
+    def test_checksum_np(self):
+        numpy = pytest.importorskip("numpy")
+        with patch("asyncping3.numpy", numpy):
+            for data in (bytes(range(256)) * 6, bytes(range(256)) * 6 + b"\xff", b"\xff" * 1001):
+                self.assertEqual(ping3._checksum_np(data), ping3._checksum_py(data))
+
+    def test_checksum_nb(self):
+        pytest.importorskip("numpy")
+        pytest.importorskip("numba")
+        self.assertIs(ping3._load_checksum_large(), ping3._checksum_nb)
+        for data in (bytes(range(256)) * 6, bytes(range(256)) * 6 + b"\xff", b"\xff" * 1001):
+            self.assertEqual(ping3._checksum_nb(data), ping3._checksum_py(data))
+
+    def test_read_ip_header(self):
+        raw = bytes.fromhex("45000054000140004001f6a0c0a8011408080808")
+        ip_header = ping3.read_ip_header(raw)
+        self.assertEqual(list(ip_header), ['version', 'tos', 'len', 'id', 'flags', 'ttl', 'protocol', 'checksum', 'src_addr', 'dest_addr'])
+        self.assertEqual(ip_header['ttl'], 64)
+        self.assertEqual(ip_header['src_addr'], "192.168.1.20")
+        self.assertEqual(ip_header['dest_addr'], "8.8.8.8")
+
+    @staticmethod
+    def fake_getaddrinfo(calls):
+        async def getaddrinfo(host, port, family=0):
+            calls.append(host)
+            return [(socket.AF_INET, socket.SOCK_RAW, 0, '', ("10.0.0.{}".format(len(calls)), 0))]
+        return getaddrinfo
+
+    @pytest.mark.anyio
+    async def test_resolve_ip_address(self):
+        calls = []
+        with patch("anyio.getaddrinfo", new=self.fake_getaddrinfo(calls)), patch.dict(ping3._resolved, clear=True):
+            self.assertEqual(await ping3._resolve("192.168.1.1"), "192.168.1.1")
+            self.assertEqual(calls, [])
+            self.assertEqual(ping3._resolved, {})
+
+    @pytest.mark.anyio
+    async def test_resolve_cache_hit(self):
+        calls = []
+        with patch("anyio.getaddrinfo", new=self.fake_getaddrinfo(calls)), patch.dict(ping3._resolved, clear=True):
+            self.assertEqual(await ping3._resolve("host.test"), "10.0.0.1")
+            self.assertEqual(await ping3._resolve("host.test"), "10.0.0.1")
+            self.assertEqual(calls, ["host.test"])
+
+    @pytest.mark.anyio
+    async def test_resolve_cache_expiry(self):
+        calls = []
+        with patch("anyio.getaddrinfo", new=self.fake_getaddrinfo(calls)), patch.dict(ping3._resolved, clear=True):
+            with patch("time.monotonic", return_value=1000.0):
+                self.assertEqual(await ping3._resolve("host.test"), "10.0.0.1")
+            with patch("time.monotonic", return_value=1000.0 + ping3.DNS_CACHE_TIME - 1):
+                self.assertEqual(await ping3._resolve("host.test"), "10.0.0.1")  # Still cached.
+            with patch("time.monotonic", return_value=1000.0 + ping3.DNS_CACHE_TIME):
+                self.assertEqual(await ping3._resolve("host.test"), "10.0.0.2")  # Expired, looked up again.
+            self.assertEqual(calls, ["host.test", "host.test"])
+
+    @pytest.mark.anyio
+    async def test_resolve_cache_eviction(self):
+        calls = []
+        with patch("anyio.getaddrinfo", new=self.fake_getaddrinfo(calls)), patch.dict(ping3._resolved, clear=True), patch("asyncping3.DNS_CACHE_SIZE", 2):
+            await ping3._resolve("a.test")
+            await ping3._resolve("b.test")
+            await ping3._resolve("c.test")  # Cache full, "a.test" is the oldest.
+            self.assertEqual(list(ping3._resolved), ["b.test", "c.test"])
+            await ping3._resolve("b.test")
+            self.assertEqual(calls, ["a.test", "b.test", "c.test"])
+
+    @staticmethod
+    def udp_pair():
+        """Loopback UDP sockets standing in for an unprivileged ICMP socket, the receiver's port is its ICMP ID on Linux."""
+        rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        rx.bind(("127.0.0.1", 0))
+        rx.setblocking(False)
+        tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        tx.connect(rx.getsockname())
+        return rx, tx
+
+    @staticmethod
+    def echo_reply(icmp_id, seq, payload):
+        return ping3._ICMP_HDR.pack(ping3.IcmpType.ECHO_REPLY, 0, 0, icmp_id, seq) + payload
+
+    @pytest.mark.anyio
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Unprivileged ICMP sockets have no IP header on Linux only.")
+    async def test_receive_short_payload(self):
+        rx, tx = self.udp_pair()
+        with rx, tx:
+            icmp_id = rx.getsockname()[1]
+            tx.send(self.echo_reply(icmp_id, 9, ping3._TIME.pack(0)))  # Other seq, leaves a time in the receive buffer.
+            tx.send(self.echo_reply(icmp_id, 1, b"\x00" * 4))  # Too short to hold a time.
+            tx.send(self.echo_reply(icmp_id, 1, ping3._TIME.pack(time.monotonic_ns())))
+            delay = await ping3.receive_one_ping(sock=rx, icmp_id=icmp_id, seq=1, timeout=1)
+        self.assertLess(delay, 1)
+
+    @pytest.mark.anyio
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Unprivileged ICMP sockets have no IP header on Linux only.")
+    async def test_receive_late_reply(self):
+        rx, tx = self.udp_pair()
+        with rx, tx:
+            icmp_id = rx.getsockname()[1]
+            send_time = time.monotonic_ns()
+            tx.send(self.echo_reply(icmp_id, 0, ping3._TIME.pack(send_time - 10 ** 9)))  # Reply to a timed out ping a second ago, same ID and seq.
+            tx.send(self.echo_reply(icmp_id, 0, ping3._TIME.pack(send_time)))
+            delay = await ping3.receive_one_ping(sock=rx, icmp_id=icmp_id, seq=0, timeout=1, send_time=send_time)
+        self.assertLess(delay, 1)
+
+    def test_pooled_socket_drain(self):
+        rx, tx = self.udp_pair()
+        with rx, tx, patch("asyncping3._create_socket", return_value=rx) as fake_create, patch.dict(ping3._sock_pool, clear=True):
+            with ping3._pooled_socket() as sock:
+                self.assertIs(sock, rx)
+            tx.send(b"late reply")
+            with ping3._pooled_socket() as sock:
+                self.assertIs(sock, rx)  # Idle socket checked out again.
+                with self.assertRaises(BlockingIOError):
+                    sock.recv(1500)  # Queued packet was drained.
+            self.assertEqual(fake_create.call_count, 1)
+            self.assertEqual(ping3._sock_pool[(None, None, None)], [rx])
+
+    def test_after_fork_in_child(self):
+        rx, tx = self.udp_pair()
+        with rx, tx, patch.dict(ping3._sock_pool, {(None, None, None): [rx]}, clear=True), patch("asyncping3._process_id", ping3._process_id), patch("os.getpid", return_value=12345):
+            ping3._after_fork_in_child()
+            self.assertEqual(ping3._process_id, 12345)
+            self.assertEqual(rx.fileno(), -1)  # Parent's idle sockets are closed.
+
     @pytest.mark.anyio
     async def test_ping_normal(self):
         delay = await ping3.ping(DEST_DOMAIN)
@@ -66,6 +201,81 @@ class TestPing3:
             except ping3.errors.HostUnknown as e:
                 self.assertEqual(e.dest_addr, "not.exist.com")
 
+    @pytest.mark.anyio
+    async def test_ping_sock(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP) as sock:
+            delay = await ping3.ping("127.0.0.1", sock=sock)
+            self.assertIsInstance(delay, float)
+            self.assertNotEqual(sock.fileno(), -1)  # Supplied socket is left open.
+
+    @pytest.mark.anyio
+    async def test_verbose_ping_sock(self):
+        with patch("sys.stdout", new=io.StringIO()) as fake_out:
+            with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP) as sock:
+                await ping3.verbose_ping("127.0.0.1", sock=sock)
+            self.assertEqual(fake_out.getvalue().count("ms\n"), 4)
+
+    @pytest.mark.anyio
+    async def test_verbose_ping_concurrent(self):
+        ping3.EXCEPTIONS = False
+        with patch("sys.stdout", new=io.StringIO()) as fake_out:
+            await ping3.verbose_ping("127.0.0.1", count=ping3.MAX_CONCURRENT_PINGS + 2)
+        lines = fake_out.getvalue().splitlines()
+        self.assertEqual(len(lines), ping3.MAX_CONCURRENT_PINGS + 2)
+        for line in lines:
+            self.assertRegex(line, r"^ping '127\.0\.0\.1' \.\.\. [0-9]+ms$")
+
+    @pytest.mark.anyio
+    async def test_verbose_ping_concurrent_order(self):
+        ping3.EXCEPTIONS = True
+        real_ping = ping3.ping
+
+        async def slow_ping(dest_addr, seq, *args, **kwargs):
+            await anyio.sleep((5 - seq) / 100)  # Later pings finish first.
+            if seq == 3:
+                raise errors.Timeout(timeout=1)  # As ping() does with EXCEPTIONS = True.
+            await real_ping(dest_addr, seq=seq, *args, **kwargs)
+            return seq
+
+        with patch("sys.stdout", new=io.StringIO()) as fake_out, patch("asyncping3.ping", new=slow_ping):
+            with self.assertRaises(errors.Timeout):
+                await ping3.verbose_ping("127.0.0.1", count=5)
+        self.assertEqual(fake_out.getvalue().splitlines(), ["ping '127.0.0.1' ... {}ms".format(i) for i in range(3)])
+
+    @pytest.mark.anyio
+    async def test_ping_reuse_socket(self):
+        ping3.close_all()
+        await ping3.ping("127.0.0.1")
+        idle = ping3._sock_pool[(None, None, None)]
+        self.assertEqual(len(idle), 1)
+        sock = idle[0]
+        await ping3.ping("127.0.0.1")
+        self.assertIs(idle[0], sock)  # Same socket checked out and put back.
+        ping3.close_all()
+        self.assertEqual(sock.fileno(), -1)
+
+    @pytest.mark.anyio
+    async def test_make_pinger(self):
+        pinger = ping3.make_pinger("127.0.0.1", unit="ms")
+        self.assertIsInstance(await pinger(), float)
+        self.assertIsInstance(await pinger(seq=1), float)
+
+    @pytest.mark.anyio
+    async def test_make_pinger_seq(self):
+        pinger = ping3.make_pinger("127.0.0.1")
+        with patch("asyncping3.receive_one_ping", return_value=0.001) as fake_receive:
+            await pinger()
+            await pinger()
+            await pinger(seq=7)
+            await pinger()
+        self.assertEqual([call.kwargs["seq"] for call in fake_receive.call_args_list], [0, 1, 7, 2])
+
+    @pytest.mark.anyio
+    async def test_make_pinger_error(self):
+        ping3.EXCEPTIONS = False
+        pinger = ping3.make_pinger("not.exist.com")
+        self.assertFalse(await pinger())
+
     @pytest.mark.anyio
     async def test_ping_seq(self):
         delay = await ping3.ping(DEST_DOMAIN, seq=199)